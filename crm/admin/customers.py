@@ -148,7 +148,7 @@ class CustomerAdmin(ModelAdmin):
         if request.resolver_match is not None and request.resolver_match.url_name == 'crm_customer_change':
             return queryset
 
-        return queryset.prefetch_related('subscriptions', 'classes', 'user').filter(user__teacher_data__isnull=True)
+        return queryset.select_related('user').prefetch_related('subscriptions', 'classes').filter(user__teacher_data__isnull=True)
 
     def Languages(self, instance):
         if not instance.languages.count():
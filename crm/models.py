@@ -6,6 +6,7 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import models
 from django.shortcuts import resolve_url
+from django.utils.functional import cached_property
 from django_countries.fields import CountryField
 from image_cropping import ImageRatioField
 from image_cropping.templatetags.cropping import cropped_thumbnail
@@ -49,7 +50,7 @@ class Customer(models.Model):
 
     The model automatically assigned to a current user, so you can access all CRM properties via `request.user.crm`.
     """
-    LEVELS = [(a + str(i), a + str(i)) for i in range(1, 4) for a in ('A', 'B', 'C')]
+    LEVELS = tuple((a + str(i), a + str(i)) for i in range(1, 4) for a in ('A', 'B', 'C'))
     GREETINGS = (
         ('empty', 'A user without a single class, even the trial one'),
         ('trial', "User has a single trial class and didn't schedule it yet"),
@@ -61,6 +62,8 @@ class Customer(models.Model):
         ('subscription-finished', "user's subscription has finished, but he has some non-subscription-lessons"),
     )
 
+    objects = CustomerManager()
+
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='crm')
 
     curator = models.ForeignKey('teachers.Teacher', on_delete=models.SET_NULL, null=True, blank=True, related_name='patronized_customers')
@@ -104,8 +107,13 @@ class Customer(models.Model):
     def get_absolute_url(self):
         return resolve_url('admin:crm_customer_change', self.pk)
 
-    @property
+    @cached_property
     def full_name(self):
+        """
+        The result is cached per instance — full_name is hit by __str__ and
+        by every admin row, and the underlying user does not change within
+        the instance lifetime.
+        """
         return '%s %s' % (self.first_name, self.last_name)
 
     @property
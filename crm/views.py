@@ -32,7 +32,7 @@ def mailchimp_csv(request, ids):
 
     writer.writerow(['Email', 'First name', 'Last name'])
 
-    for user in User.objects.filter(crm__id__in=ids).values_list('email', 'first_name', 'last_name'):
+    for user in User.objects.filter(crm__id__in=ids).values_list('email', 'first_name', 'last_name').iterator():
         if not len(user[0]):  # if there is no email
             continue
         writer.writerow(user)
@@ -54,7 +54,7 @@ def export_last_lessons(request, customers, start, end):
         start__range=(start, end),
         classes__customer__in=customers,
         is_finished=True,
-    ).distinct().order_by('start'):
+    ).distinct().order_by('start').iterator():
         students = ', '.join(str(i.customer) for i in entry.classes.all())
         writer.writerow([
             date_format(entry.start, format='SHORT_DATETIME_FORMAT'),
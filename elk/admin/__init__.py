@@ -4,6 +4,7 @@ Abstract admin classes. All your ModelAdmins should be subclasses from this Mode
 from django.contrib import admin
 
 from .model_admin import *  # noqa
+from .paginator import FasterAdminPaginator  # noqa
 
 
 admin.site.disable_action('delete_selected')  # disable delete selected action site-wide
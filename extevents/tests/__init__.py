@@ -11,13 +11,22 @@ class GoogleCalendarTestCase(TestCase):
     of :model:`extevents.GoogleCalendar` and provides method to read calendars
     from fixtures and to mock calendar events.
     """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        The teacher fixture is by far the most expensive part of the setup and
+        it never changes, so it is created once per test class instead of once
+        per test method.
+        """
+        cls.teacher = create_teacher()
+
     def setUp(self):
-        self.teacher = create_teacher()
         self.src = models.GoogleCalendar(
             teacher=self.teacher,
             url='http://testing'
         )
         self.src.save()
+        self.src.events = []  # reset polled events — the default is a mutable class-level attribute
 
         patcher = patch('extevents.models.timezone')
         timezone = patcher.start()
@@ -7,9 +7,24 @@ from extevents.tests import GoogleCalendarTestCase
 class TestEventSourceSafety(GoogleCalendarTestCase):
     def setUp(self):
         super().setUp()
-        self.src.events = []
         self.safe_mixer = Mixer(commit=False)
 
+    def _create_saved_events(self, count, **kwargs):
+        """
+        Persist `count` events with a single INSERT. The safety check only
+        counts events, so we don't need mixer to invent their content.
+        """
+        return ExternalEvent.objects.bulk_create([
+            ExternalEvent(
+                teacher=self.teacher,
+                src=self.src,
+                start=self.tzdatetime('UTC', 2023, 9, 11, 10, 0),
+                end=self.tzdatetime('UTC', 2023, 9, 11, 11, 0),
+                description='',
+                **kwargs
+            ) for i in range(count)
+        ])
+
     def test_is_safe_by_default(self):
         """
         By default all should be safe
@@ -20,8 +35,7 @@ class TestEventSourceSafety(GoogleCalendarTestCase):
         """
         Try to replace 10 events by 8 events
         """
-        for i in range(0, 10):
-            mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src)
+        self._create_saved_events(10)
 
         for i in range(0, 8):  # create 8 non-saved events
             self.src.events.append(
@@ -34,11 +48,10 @@ class TestEventSourceSafety(GoogleCalendarTestCase):
         """
         Try to replace 12 events (10 of them recurring) with 2 events
         """
-        mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src)  # some event
-        parent_event = mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src)  # this event will be parent to 10 others
+        self._create_saved_events(1)  # some event
+        parent_event = mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src)  # this event will be parent to 10 others; blended separately because bulk_create does not return a pk on every database
 
-        for i in range(0, 10):
-            mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src, parent=parent_event)
+        self._create_saved_events(10, parent=parent_event)
 
         for i in range(0, 2):  # create 2 non-saved events
             self.src.events.append(
@@ -51,8 +64,7 @@ class TestEventSourceSafety(GoogleCalendarTestCase):
         """
         Try to replace 10 events by 0 events
         """
-        for i in range(0, 10):
-            mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src)
+        self._create_saved_events(10)
 
         self.assertFalse(self.src._ExternalEventSource__is_safe())
 
@@ -60,8 +72,7 @@ class TestEventSourceSafety(GoogleCalendarTestCase):
         """
         Try to replace 10 events by 3 events
         """
-        for i in range(0, 10):
-            mixer.blend(ExternalEvent, teacher=self.teacher, src=self.src)
+        self._create_saved_events(10)
 
         for i in range(0, 3):  # create 3 non-saved events
             self.src.events.append(
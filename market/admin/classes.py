@@ -1,6 +1,8 @@
 from django.contrib import admin
+from django.db.models import BooleanField, Case, Value, When
 
 from elk.admin.filters import BooleanFilter
+from elk.admin.paginator import FasterAdminPaginator
 from market.admin.actions import MarkAsUsedForm, mark_as_used, renew
 from market.admin.components import IsFinishedFilter, ProductContainerAdmin
 from market.models import Class
@@ -34,7 +36,31 @@ class ClassAdmin(ProductContainerAdmin):
             'fields': ('customer', 'buy_price', 'lesson_type', 'teacher')
         }),
     )
-    list_select_related = True
+    list_select_related = ('customer__user', 'lesson_type')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """
+        Compute the `available` column in SQL for the whole page at once
+        instead of evaluating it per row in python.
+        """
+        return super().get_queryset(request).annotate(
+            _available=Case(
+                When(is_fully_used=False, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
+    def available(self, instance):
+        if hasattr(instance, '_available'):
+            return instance._available
+
+        return super().available(instance)  # single instances, i.e. on the change form, don't have the annotation
+
+    available.boolean = True
+    available.admin_order_field = '-is_fully_used'
 
     def teacher(self, instance):
         if not self.available(instance):
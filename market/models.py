@@ -129,8 +129,11 @@ class Subscription(ProductContainer):
         When creating new subscription, we should make included lessons
         available for the customer.
         """
-        for lesson_type in self.product.lesson_types():
-            for lesson in self.product.classes_by_lesson_type(lesson_type):
+        product = self.product.__class__.objects.prefetch_related(*self.product.LESSONS).get(pk=self.product_id)
+
+        classes = []
+        for lesson_type in product.lesson_types():
+            for lesson in product.classes_by_lesson_type(lesson_type):
                 c = Class(
                     lesson_type=lesson.get_contenttype(),
                     subscription=self,
@@ -140,7 +143,9 @@ class Subscription(ProductContainer):
                 )
                 if hasattr(self, 'request'):
                     c.request = self.request  # bypass request object for later analysis
-                c.save()
+                classes.append(c)
+
+        Class.objects.bulk_create(classes)  # the classes are not scheduled yet, so we can skip their save() logic and insert everything in one query
 
     def __store_duration(self):
         """
@@ -153,8 +158,16 @@ class Subscription(ProductContainer):
         When the subscription is disabled for any reasons, all lessons
         assosciated to it, should be disabled too.
         """
-        for c in self.classes.filter(is_fully_used=False):
+        classes_to_deactivate = self.classes.filter(is_fully_used=False)
+
+        for c in classes_to_deactivate.filter(is_scheduled=True):  # scheduled classes need a real save() — their timeline entries should be notified
             c.deactivate()
+
+        classes_to_deactivate.update(is_fully_used=True)  # the rest can be disabled with a single UPDATE
+
+        self.update_first_lesson_date()
+        self.check_is_fully_finished()
+
         signals.subscription_deactivated.send(sender=self.__class__, user=user, instance=self)
 
     def check_is_fully_finished(self):
@@ -264,13 +277,12 @@ class ClassesManager(ProductContainerManager):
         """
         types = self.get_queryset().filter(is_scheduled=False).values_list('lesson_type', flat=True).distinct()
 
-        ContentType.objects.filter(pk__in=types)
-
         sort_order = {}
         # Sort found lessons by order, defined in their sort_order() methods.
         # If a lesson does not implement such method, it will be excluded from
         # sort results.
-        for t in ContentType.objects.filter(pk__in=types):
+        for pk in types:
+            t = ContentType.objects.get_for_id(pk)  # served from the in-memory contenttype cache
             Model = t.model_class()
             order = Model.sort_order()
             if order:
@@ -303,7 +315,7 @@ class ClassesManager(ProductContainerManager):
 
     def dates_for_planning(self):
         """
-        A generator of dates, available for planning for particular user
+        A list of dates, available for planning for particular user
 
         If current time + planning delta is more then 00:00 then the first day is tomorrow
         """
@@ -312,9 +324,7 @@ class ClassesManager(ProductContainerManager):
         if timezone.localtime(current + settings.PLANNING_DELTA).day != timezone.localtime(current).day:
             current += timedelta(days=1)
 
-        for i in range(0, 14):
-            yield current
-            current += timedelta(days=1)
+        return [current + timedelta(days=i) for i in range(0, 14)]
 
     def used(self):
         return self.get_queryset().filter(is_fully_used=True)
@@ -450,6 +460,7 @@ class Class(ProductContainer):
             old_entry = Class.objects.get(pk=self.pk).timeline
             super().save(*args, **kwargs)
             old_entry.save()
+            return
 
         super().save(*args, **kwargs)
 
@@ -486,10 +497,11 @@ class Class(ProductContainer):
         Method for scheduling a lesson that does not require a timeline entry.
         allow_besides_working_hours should be set to True only when testing.
         """
-        Lesson = self.lesson_type.model_class()
+        lesson_type = ContentType.objects.get_for_id(self.lesson_type_id)  # hits the in-memory contenttype cache instead of dereferencing the FK
+        Lesson = lesson_type.model_class()
 
         if Lesson.timeline_entry_required():  # every lesson model should define if it requires a timeline entry or not. For details, see :model:`lessons.Lesson`
-            raise exceptions.CannotBeScheduled("Lesson '%s' requieres a teachers timeline entry" % self.lesson_type)
+            raise exceptions.CannotBeScheduled("Lesson '%s' requieres a teachers timeline entry" % lesson_type)
 
         entry = self.__get_entry(**kwargs)
         self.assign_entry(entry)
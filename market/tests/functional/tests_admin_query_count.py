@@ -0,0 +1,39 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from elk.utils.testing import ClientTestCase, create_customer
+from lessons import models as lessons
+from market.models import Class
+
+
+class TestClassAdminQueryCount(ClientTestCase):
+    """
+    Guard for the N+1 fixes on the purchased lessons changelist: the number of
+    queries should stay the same no matter how many rows are displayed.
+
+    The baseline is captured from the page itself instead of being hardcoded,
+    so the guard does not break when an unrelated constant query is added.
+    """
+    def _buy_classes(self, count):
+        for i in range(count):
+            c = Class(
+                customer=create_customer(),
+                lesson_type=lessons.OrdinaryLesson.get_contenttype(),
+            )
+            c.save()
+
+    def _changelist_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.c.get('/admin/market/class/')
+            self.assertEqual(response.status_code, 200)
+
+        return len(queries)
+
+    def test_query_count_does_not_depend_on_row_count(self):
+        self._buy_classes(3)
+        self._changelist_query_count()  # warm up the contenttype and permission caches
+
+        baseline = self._changelist_query_count()
+
+        self._buy_classes(10)
+        self.assertEqual(self._changelist_query_count(), baseline)
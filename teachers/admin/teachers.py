@@ -45,6 +45,7 @@ class GooogleCalendarInline(TabularInline):
 @admin.register(Teacher)
 class TeacherAdmin(ModelAdmin):
     list_display = ('__str__', 'CRM_profile', 'email', 'skype', 'month_class_count', 'lessons_allowed')
+    list_select_related = ('user', 'user__crm')
 
     inlines = (WorkingHoursInline, GooogleCalendarInline)
 
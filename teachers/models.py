@@ -270,7 +270,7 @@ class Teacher(models.Model):
             return
 
         try:
-            Lesson = ContentType.objects.get(pk=lesson_type).model_class()
+            Lesson = ContentType.objects.get_for_id(lesson_type).model_class()  # served from the in-memory contenttype cache
         except ContentType.DoesNotExist:
             return
 
@@ -88,7 +88,10 @@ class TestTeacherAvaliableLessons(TestCase):
         self.assertEqual(res[0].get_contenttype(), lessons.OrdinaryLesson.get_contenttype())
 
     def test_unhosted_lessons_fail_due_to_no_permission(self):
-        mixer.blend(lessons.OrdinaryLesson)
+        """
+        The lessons fixture already contains ordinary lessons, so there is no
+        need to blend one more — the teacher simply is not allowed to host them.
+        """
         res = self.teacher.available_lessons(lesson_type=lessons.OrdinaryLesson.get_contenttype())
 
         self.assertEqual(len(res), 0)